@@ -1,11 +1,12 @@
 from easybuild.tools.entrypoints import EntrypointHook
 from easybuild.tools.hooks import CONFIGURE_STEP, START
 
+_HELLO_BANNER = '\n'.join(["Hello, World! ----------------------------------------"] * 5)
+
 
 @EntrypointHook(START)
 def hello_world():
-    for i in range(5):
-        print("Hello, World! ----------------------------------------")
+    print(_HELLO_BANNER)
 
 @EntrypointHook(CONFIGURE_STEP, pre_step=True)
 def test_pre_configure(*args, **kwargs):
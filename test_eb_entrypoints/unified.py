@@ -1,5 +1,6 @@
 
-import re
+import functools
+import types
 
 import easybuild.tools.systemtools as systemtools
 from easybuild.toolchains.fft.fftw import Fftw
@@ -16,6 +17,28 @@ from easybuild.tools.toolchain.toolchain import SYSTEM_TOOLCHAIN_NAME
 TC_CONSTANT_LLVM = "LLVM"
 
 
+@functools.lru_cache(maxsize=None)
+def _normalized_looseversion(version):
+    """Return toolchain version as a LooseVersion that is safe to compare with e.g. '2019'."""
+    # need to transform a version like '2018b' with something that is safe to compare with '2019'
+    # comparing subversions that include letters causes TypeErrors in Python 3
+    # 'a' is assumed to be equivalent with '.01' (January), and 'b' with '.07' (June) (good enough for this purpose)
+    return LooseVersion(version.replace('a', '.01').replace('b', '.07'))
+
+
+# toolchains older than 2023b should not exist (need GCC >= 13)
+_LV_2023 = LooseVersion('2023')
+
+
+@functools.lru_cache(maxsize=None)
+def _flang_unsupported_ranges(compiler_class):
+    """Return `FLANG_UNSUPPORTED_VARS` of the given compiler class, with the version bounds parsed as LooseVersion."""
+    return [
+        (LooseVersion(v_min), LooseVersion(v_max), flags)
+        for v_min, v_max, flags in compiler_class.FLANG_UNSUPPORTED_VARS
+    ]
+
+
 class LLVM(Compiler):
     """Compiler toolchain with Clang and GFortran compilers."""
     # NAME = 'LLVMcore'
@@ -39,7 +62,7 @@ class LLVM(Compiler):
         ])
     ]
 
-    FORTRAN_FLAGS = ['FCFLAGS', 'FFLAGS', 'F90FLAGS']
+    FORTRAN_FLAGS = frozenset(('FCFLAGS', 'FFLAGS', 'F90FLAGS'))
 
     COMPILER_UNIQUE_OPTS = {
         'loop-vectorize': (False, "Loop vectorization"),
@@ -108,18 +131,19 @@ class LLVM(Compiler):
     COMPILER_F_OPTIONS = []
 
     # used when 'optarch' toolchain option is enabled (and --optarch is not specified)
-    COMPILER_OPTIMAL_ARCHITECTURE_OPTION = {
+    # (read-only, these are lookup tables shared by all subclasses)
+    COMPILER_OPTIMAL_ARCHITECTURE_OPTION = types.MappingProxyType({
         (systemtools.POWER, systemtools.POWER): '-mcpu=native',  # no support for march=native on POWER
         (systemtools.POWER, systemtools.POWER_LE): '-mcpu=native',  # no support for march=native on POWER
         (systemtools.X86_64, systemtools.AMD): '-march=native',
         (systemtools.X86_64, systemtools.INTEL): '-march=native',
-    }
+    })
     # used with --optarch=GENERIC
-    COMPILER_GENERIC_OPTION = {
+    COMPILER_GENERIC_OPTION = types.MappingProxyType({
         (systemtools.RISCV64, systemtools.RISCV): '-march=rv64gc -mabi=lp64d',  # default for -mabi is system-dependent
         (systemtools.X86_64, systemtools.AMD): '-march=x86-64 -mtune=generic',
         (systemtools.X86_64, systemtools.INTEL): '-march=x86-64 -mtune=generic',
-    }
+    })
 
     COMPILER_CC = 'clang'
     COMPILER_CXX = 'clang++'
@@ -136,23 +160,27 @@ class LLVM(Compiler):
     def _set_compiler_flags(self):
         super()._set_compiler_flags()
 
+        version = LooseVersion(self.version)
         unsupported_fortran_flags = None
-        for v_min, v_max, flags in self.FLANG_UNSUPPORTED_VARS:
-            if LooseVersion(self.version) >= LooseVersion(v_min) and LooseVersion(self.version) < LooseVersion(v_max):
+        for v_min, v_max, flags in _flang_unsupported_ranges(type(self)):
+            if v_min <= version < v_max:
                 unsupported_fortran_flags = flags
                 break
         else:
             self.log.debug("No unsupported flags found for LLVM version %s", self.version)
 
-        if unsupported_fortran_flags is not None:
-            self.log.debug(
-                f"Ensuring usupported Fortran flags `{unsupported_fortran_flags}` are removed from variables"
-            )
-            for key, lst in self.variables.items():
-                if key not in self.FORTRAN_FLAGS:
-                    continue
-                for item in lst:
-                    item.try_remove(unsupported_fortran_flags)
+        if unsupported_fortran_flags is None:
+            return
+
+        self.log.debug(
+            f"Ensuring usupported Fortran flags `{unsupported_fortran_flags}` are removed from variables"
+        )
+        for key in self.FORTRAN_FLAGS:
+            lst = self.variables.get(key)
+            if not lst:
+                continue
+            for item in lst:
+                item.try_remove(unsupported_fortran_flags)
 
 
 @EntrypointToolchain()
@@ -179,17 +207,19 @@ class Lompi(LLVMtc, OpenMPI):
 
     def is_deprecated(self):
         """Return whether or not this toolchain is deprecated."""
-        # need to transform a version like '2018b' with something that is safe to compare with '2019'
-        # comparing subversions that include letters causes TypeErrors in Python 3
-        # 'a' is assumed to be equivalent with '.01' (January), and 'b' with '.07' (June) (good enough for this purpose)
-        version = self.version.replace('a', '.01').replace('b', '.07')
+        return self._deprecated
+
+    @functools.cached_property
+    def _deprecated(self):
+        """Whether or not this toolchain is deprecated (only determined once, the version does not change)."""
+        version = _normalized_looseversion(self.version)
 
         deprecated = False
 
         # make sure a non-symbolic version (e.g., 'system') is used before making comparisons using LooseVersion
-        if re.match('^[0-9]', version):
+        if version.vstring[:1].isdigit():
             # lompi toolchains older than 2023b should not exist  (need GCC >= 13)
-            if LooseVersion(version) < LooseVersion('2023'):
+            if version < _LV_2023:
                 deprecated = True
 
         return deprecated
@@ -213,22 +243,21 @@ class LFoss(Lompi, FlexiBLAS, ScaLAPACK, Fftw):
         Lfbf.NAME
     ]
 
+    # BLAS/LAPACK settings of FlexiBLAS, set on each instance in the constructor
+    _FLEXIBLAS_INHERITED = {
+        constant: getattr(FlexiBLAS, constant) for constant in (
+            'BLAS_MODULE_NAME', 'BLAS_LIB', 'BLAS_LIB_MT', 'BLAS_FAMILY',
+            'LAPACK_MODULE_NAME', 'LAPACK_IS_BLAS', 'LAPACK_FAMILY',
+        )
+    }
+
     def __init__(self, *args, **kwargs):
         """Toolchain constructor."""
         super(LFoss, self).__init__(*args, **kwargs)
 
-        # need to transform a version like '2018b' with something that is safe to compare with '2019'
-        # comparing subversions that include letters causes TypeErrors in Python 3
-        # 'a' is assumed to be equivalent with '.01' (January), and 'b' with '.07' (June) (good enough for this purpose)
-        version = self.version.replace('a', '.01').replace('b', '.07')
+        self.looseversion = _normalized_looseversion(self.version)
 
-        self.looseversion = LooseVersion(version)
-
-        constants = ('BLAS_MODULE_NAME', 'BLAS_LIB', 'BLAS_LIB_MT', 'BLAS_FAMILY',
-                     'LAPACK_MODULE_NAME', 'LAPACK_IS_BLAS', 'LAPACK_FAMILY')
-
-        for constant in constants:
-            setattr(self, constant, getattr(FlexiBLAS, constant))
+        self.__dict__.update(self._FLEXIBLAS_INHERITED)
 
     def banned_linked_shared_libs(self):
         """
@@ -243,11 +272,12 @@ class LFoss(Lompi, FlexiBLAS, ScaLAPACK, Fftw):
 
         return res
 
-    def is_deprecated(self):
-        """Return whether or not this toolchain is deprecated."""
+    @functools.cached_property
+    def _deprecated(self):
+        """Whether or not this toolchain is deprecated (see `Lompi.is_deprecated`)."""
 
         # lfoss toolchains older than 2023b should not exist (need GCC >= 13)
-        if self.looseversion < LooseVersion('2023'):
+        if self.looseversion < _LV_2023:
             deprecated = True
         else:
             deprecated = False